@@ -1,6 +1,16 @@
 import numpy as np
 import pandas as pd
 
+_RNG = np.random.default_rng()
+
+# Dice with fewer faces than this sample by bisecting the cumulative weights;
+# larger dice use the alias table.
+ALIAS_MIN_FACES = 64
+
+# Rows of the results compared at a time when counting jackpots, so the
+# intermediate boolean buffers stay cache resident.
+JACKPOT_CHUNK_ROWS = 1 << 16
+
 class Die:
     """
     Represents a die with multiple faces and weights, which can be rolled to randomly select a face.
@@ -14,32 +24,107 @@ class Die:
         """
         if not isinstance(faces, np.ndarray):
             raise TypeError("Faces must be a numpy array.")
-        if len(faces) != len(set(faces)):
+        # Object faces may mix types that cannot be sorted, so np.unique is only used for typed arrays.
+        num_distinct = len(set(faces)) if faces.dtype == object else np.unique(faces).size
+        if num_distinct != faces.size:
             raise ValueError("Faces must be distinct.")
-        
-        self._df = pd.DataFrame({
-            'face': faces,
-            'weight': np.ones(len(faces))
-        }).set_index('face')
+
+        self._faces = faces.copy()
+        self._weights = np.ones(len(faces))
+        self._face_to_idx = {f: i for i, f in enumerate(self._faces)}
+        self._probs = None
+        self._dirty = True
+
+    def _ensure_probs(self):
+        """
+        Renormalizes the weights, and the caches derived from them, only if they changed since the last roll.
+
+        """
+        if self._dirty:
+            self._refresh_probs()
+
+    def _refresh_probs(self):
+        """
+        Caches the normalized probabilities and the sampling tables built from them.
+
+        """
+        total = self._weights.sum()
+        if total <= 0:
+            raise ValueError("Weights must sum to a positive value.")
+        self._dirty = False
+        self._probs = self._weights / total
+        self._cumw = np.cumsum(self._probs)
+        self._total = self._cumw[-1]
+        if len(self._faces) >= ALIAS_MIN_FACES:
+            self._rebuild_alias()
+
+    def _rebuild_alias(self):
+        """
+        Builds the Walker alias table used to sample a face in constant time.
+
+        """
+        n = len(self._probs)
+        scaled = self._probs * n
+        self._alias_prob = np.ones(n)
+        self._alias_alias = np.arange(n)
+        small = [i for i in range(n) if scaled[i] < 1.0]
+        large = [i for i in range(n) if scaled[i] >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self._alias_prob[s] = scaled[s]
+            self._alias_alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
 
     def change_weight(self, face, weight):
         """
         Changes the weight of a specific face.
 
         """
-        if face not in self._df.index:
+        if face not in self._face_to_idx:
             raise IndexError("Face not found in the die.")
         if not isinstance(weight, (int, float)):
             raise TypeError("Weight must be a numeric type.")
-        
-        self._df.loc[face, 'weight'] = weight
+        if weight < 0:
+            raise ValueError("Weight must not be negative.")
+
+        self._change_weight_unchecked(self._face_to_idx[face], float(weight))
+
+    def _change_weight_unchecked(self, idx, weight):
+        """
+        Sets the weight at a face position without validation.
+
+        """
+        self._weights[idx] = weight
+        self._dirty = True
 
     def roll(self, num_rolls=1):
         """
         Rolls the die a specified number of times.
 
         """
-        return self._df.sample(n=num_rolls, replace=True, weights='weight').index.tolist()
+        return self._decode_rolls(self._roll_codes(num_rolls))
+
+    def _roll_codes(self, num_rolls):
+        """
+        Rolls the die and returns the positions of the rolled faces rather than the faces.
+
+        """
+        self._ensure_probs()
+        if len(self._faces) < ALIAS_MIN_FACES:
+            idx = np.searchsorted(self._cumw, _RNG.random(num_rolls) * self._total, side='right')
+        else:
+            i = _RNG.integers(0, len(self._faces), size=num_rolls)
+            u = _RNG.random(num_rolls)
+            idx = np.where(u < self._alias_prob[i], i, self._alias_alias[i])
+        return idx
+
+    def _decode_rolls(self, codes):
+        """
+        Converts face positions, as produced internally by a roll, back into faces.
+
+        """
+        return self._faces[codes]
 
     def show(self):
         """
@@ -47,25 +132,57 @@ class Die:
 
        
         """
-        return self._df.copy()
+        return pd.DataFrame({'weight': self._weights.copy()}, index=pd.Index(self._faces, name='face'))
 class Game:
     def __init__(self, dice):
         self._dice = dice
         self._results = pd.DataFrame()
+        self._codes = np.empty((0, 0), dtype=np.uint16)
+        self._face_vocab = np.array([])
 
     def play(self, num_rolls):
-        results = {}
-        for i, die in enumerate(self._dice):
-            rolls = [die.roll()[0] for _ in range(num_rolls)]
-            results[f"die_{i}"] = rolls
-        self._results = pd.DataFrame(results)
-        self._results.index.name = 'roll'
+        # Roll every die before touching any state, so a failed roll leaves the previous play intact.
+        positions = [die._roll_codes(num_rolls) for die in self._dice]
+        vocab = self._build_vocab()
+        dtype = np.uint16 if len(vocab) <= np.iinfo(np.uint16).max else np.intp
+        # Map each die's face positions onto the shared game vocabulary.
+        vocab_index = pd.Index(vocab)
+        # The codes are the single preallocated matrix; the frame is assembled per column so
+        # each die keeps its own face dtype instead of being coerced to a common one.
+        codes = np.empty((num_rolls, len(self._dice)), dtype=dtype)
+        columns = {}
+        for i, (die, pos) in enumerate(zip(self._dice, positions)):
+            codes[:, i] = vocab_index.get_indexer(die._faces).astype(dtype)[pos]
+            columns[f"die_{i}"] = die._faces[pos]
+        results = pd.DataFrame(columns)
+        results.index.name = 'roll'
+        self._face_vocab, self._codes, self._results = vocab, codes, results
+
+    def _build_vocab(self):
+        """
+        Collects the distinct faces of all dice, sorted when the faces are comparable.
+
+        """
+        faces = [die._faces for die in self._dice]
+        if not faces:
+            return np.array([])
+        kinds = {f.dtype.kind for f in faces}
+        if len(kinds) == 1 and 'O' not in kinds:
+            return np.unique(np.concatenate(faces))
+        # Mixed face types are kept as objects so no die's faces are coerced.
+        vocab = pd.unique(np.concatenate([f.astype(object) for f in faces]))
+        try:
+            return np.array(sorted(vocab), dtype=object)
+        except TypeError:
+            return np.asarray(vocab, dtype=object)
 
     def show(self, form='wide'):
         if form not in ['wide', 'narrow']:
             raise ValueError("Form must be 'wide' or 'narrow'.")
         if form == 'narrow':
-            return self._results.stack().reset_index(name='outcome').rename(columns={'level_0': 'roll', 'level_1': 'die'})
+            if self._results.empty:
+                return pd.DataFrame(columns=['roll', 'die', 'outcome'])
+            return self._results.melt(var_name='die', value_name='outcome', ignore_index=False).reset_index()
         return self._results.copy()
 
 
@@ -74,34 +191,81 @@ class Analyzer:
         if not isinstance(game, Game):
             raise ValueError("Provided object must be a Game instance.")
         self._game = game
+        num_dice = len(game._dice)
+        if num_dice == 2:
+            self._jackpot_impl = self._jackpot_d2
+        elif num_dice == 3:
+            self._jackpot_impl = self._jackpot_d3
+        else:
+            self._jackpot_impl = self._jackpot_general
 
     def jackpot(self):
         if self._game._results.empty:
             return 0
-        return self._game._results.apply(lambda row: row.nunique() == 1, axis=1).sum()
+        return self._jackpot_impl(self._game._codes)
+
+    def _jackpot_d2(self, codes):
+        return int(np.count_nonzero(codes[:, 0] == codes[:, 1]))
+
+    def _jackpot_d3(self, codes):
+        return int(np.count_nonzero((codes[:, 0] == codes[:, 1]) & (codes[:, 1] == codes[:, 2])))
+
+    def _jackpot_general(self, codes):
+        chunk_rows = min(JACKPOT_CHUNK_ROWS, codes.shape[0])
+        eq = np.empty((chunk_rows, codes.shape[1]), dtype=bool)
+        hit = np.empty(chunk_rows, dtype=bool)
+        total = 0
+        for start in range(0, codes.shape[0], chunk_rows):
+            chunk = codes[start:start + chunk_rows]
+            n = chunk.shape[0]
+            np.equal(chunk, chunk[:, 0:1], out=eq[:n])
+            eq[:n].all(axis=1, out=hit[:n])
+            total += np.count_nonzero(hit[:n])
+        return total
 
     def face_counts_per_roll(self):
         if self._game._results.empty:
             print("Results DataFrame is empty.")
             return pd.DataFrame()
-        try:
-       
-            if not all(len(col) == len(self._game._results.index) for col in self._game._results.values.T):
-                print("Columns vary in length.")
-                return pd.DataFrame()
-            return pd.crosstab(index=self._game._results.index, columns=self._game._results.values.flatten())
-        except Exception as e:
-            print(f"Error in face_counts_per_roll: {e}")
-            return pd.DataFrame()
-
-
+        codes, vocab = self._game._codes, self._game._face_vocab
+        num_rolls = codes.shape[0]
+        flat = (np.arange(num_rolls)[:, None] * len(vocab) + codes).ravel()
+        counts = np.bincount(flat, minlength=num_rolls * len(vocab)).reshape(num_rolls, len(vocab))
+        return pd.DataFrame(counts, index=self._game._results.index, columns=vocab)
 
     def combo_count(self):
         if self._game._results.empty:
             return pd.DataFrame()
-        return self._game._results.apply(lambda row: tuple(sorted(row)), axis=1).value_counts().to_frame('counts')
+        arr, vocab = np.sort(self._game._codes, axis=1), self._game._face_vocab
+        base, num_dice = len(vocab), arr.shape[1]
+        if base ** num_dice <= np.iinfo(np.int64).max:
+            # Pack each sorted row into one mixed-radix integer so a 1-D unique does the grouping.
+            keys = arr[:, 0].astype(np.int64)
+            for i in range(1, num_dice):
+                keys = keys * base + arr[:, i]
+            uniq_keys, counts = np.unique(keys, return_counts=True)
+            uniq = np.empty((len(uniq_keys), num_dice), dtype=np.int64)
+            for i in range(num_dice - 1, -1, -1):
+                uniq_keys, uniq[:, i] = np.divmod(uniq_keys, base)
+        else:
+            uniq, counts = np.unique(arr, axis=0, return_counts=True)
+        index = pd.MultiIndex.from_arrays([vocab.take(col) for col in uniq.T])
+        return pd.DataFrame({'counts': counts}, index=index).sort_values('counts', ascending=False, kind='stable')
 
     def permutation_count(self):
         if self._game._results.empty:
             return pd.DataFrame()
-        return self._game._results.apply(lambda row: tuple(row), axis=1).value_counts().to_frame('counts')
+        arr, vocab = self._game._codes, self._game._face_vocab
+        bits, num_dice = max(1, (len(vocab) - 1).bit_length()), arr.shape[1]
+        if bits * num_dice <= 64:
+            # Pack each row into one uint64, first die in the high bits so keys sort like rows.
+            keys = np.zeros(arr.shape[0], dtype=np.uint64)
+            for i in range(num_dice):
+                keys |= arr[:, i].astype(np.uint64) << np.uint64(bits * (num_dice - 1 - i))
+            uniq_keys, counts = np.unique(keys, return_counts=True)
+            mask = np.uint64((1 << bits) - 1)
+            uniq = np.column_stack([(uniq_keys >> np.uint64(bits * (num_dice - 1 - i))) & mask for i in range(num_dice)])
+        else:
+            uniq, counts = np.unique(arr, axis=0, return_counts=True)
+        index = pd.MultiIndex.from_arrays([vocab.take(col) for col in uniq.T], names=self._game._results.columns)
+        return pd.DataFrame({'counts': counts}, index=index).sort_values('counts', ascending=False, kind='stable')
@@ -1,6 +1,7 @@
 import unittest
 import numpy as np
 import pandas as pd
+from Montecarlo import montecarlo
 from Montecarlo.montecarlo import Die, Game, Analyzer
 
 class TestDie(unittest.TestCase):
@@ -21,6 +22,19 @@ class TestDie(unittest.TestCase):
         with self.assertRaises(ValueError):
             Die(faces)
 
+    def test_init_with_mixed_faces(self):
+        """Test Die initialization accepts object faces of mixed types."""
+        die = Die(np.array([1, 'A', 2.5], dtype=object))
+        self.assertEqual(len(die.show()), 3)
+
+    def test_init_copies_faces(self):
+        """Test changing the caller's faces array does not change the die."""
+        faces = np.array(['A', 'B', 'C'])
+        die = Die(faces)
+        faces[0] = 'Z'
+        self.assertEqual(list(die.show().index), ['A', 'B', 'C'])
+        die.change_weight('A', 2)
+
     def test_change_weight_invalid_face(self):
         """Test changing weight of a face not existing in the die."""
         faces = np.array(['A', 'B', 'C'])
@@ -35,6 +49,22 @@ class TestDie(unittest.TestCase):
         with self.assertRaises(TypeError):
             die.change_weight('A', 'heavy')
 
+    def test_change_weight_negative(self):
+        """Test changing weight to a negative value shows error."""
+        faces = np.array(['A', 'B', 'C'])
+        die = Die(faces)
+        with self.assertRaises(ValueError):
+            die.change_weight('A', -5)
+
+    def test_roll_all_zero_weights(self):
+        """Test rolling a die whose weights are all zero shows error."""
+        faces = np.array(['A', 'B', 'C'])
+        die = Die(faces)
+        for face in faces:
+            die.change_weight(face, 0)
+        with self.assertRaises(ValueError):
+            die.roll(5)
+
     def test_roll(self):
         """Test rolling the die produces results within expected faces."""
         faces = np.array(['A', 'B', 'C'])
@@ -43,6 +73,26 @@ class TestDie(unittest.TestCase):
         for result in results:
             self.assertIn(result, faces)
 
+    def test_roll_respects_zero_weight(self):
+        """Test a face with zero weight is never rolled."""
+        faces = np.array(['A', 'B', 'C'])
+        die = Die(faces)
+        die.change_weight('B', 0)
+        results = die.roll(1000)
+        self.assertNotIn('B', results)
+
+    def test_roll_many_faces(self):
+        """Test weights are respected on a die large enough to use the alias table."""
+        faces = np.arange(100)
+        die = Die(faces)
+        for face in range(50):
+            die.change_weight(face, 0)
+        die.change_weight(99, 950)
+        results = die.roll(20000)
+        self.assertTrue((results >= 50).all())
+        share = np.mean(results == 99)
+        self.assertAlmostEqual(share, 0.95, delta=0.01)
+
     def test_show(self):
         """Test show method returns DataFrame of correct format."""
         faces = np.array(['A', 'B', 'C'])
@@ -81,6 +131,75 @@ class TestGame(unittest.TestCase):
         with self.assertRaises(ValueError):
             game.show('invalid')
 
+    def test_game_play_matches_die_rolls(self):
+        """Test each results column is what rolling that die alone would give."""
+        faces = np.array(['1', '2', '3'])
+        die1 = Die(faces)
+        die2 = Die(faces)
+        die2.change_weight('3', 5)
+        rng = montecarlo._RNG
+        try:
+            montecarlo._RNG = np.random.default_rng(0)
+            game = Game([die1, die2])
+            game.play(50)
+            montecarlo._RNG = np.random.default_rng(0)
+            expected1 = die1.roll(50)
+            expected2 = die2.roll(50)
+        finally:
+            montecarlo._RNG = rng
+        results = game.show()
+        self.assertEqual(list(results['die_0']), list(expected1))
+        self.assertEqual(list(results['die_1']), list(expected2))
+
+    def test_failed_play_keeps_previous_results(self):
+        """Test a play that fails partway leaves the earlier results and codes untouched."""
+        faces = np.array(['1', '2', '3'])
+        die1 = Die(faces)
+        die2 = Die(faces)
+        game = Game([die1, die2])
+        game.play(5)
+        results = game.show()
+        codes = game._codes.copy()
+        vocab = game._face_vocab.copy()
+        for face in faces:
+            die2.change_weight(face, 0)
+        with self.assertRaises(ValueError):
+            game.play(100)
+        pd.testing.assert_frame_equal(game.show(), results)
+        np.testing.assert_array_equal(game._codes, codes)
+        np.testing.assert_array_equal(game._face_vocab, vocab)
+        self.assertEqual(len(Analyzer(game).face_counts_per_roll()), 5)
+
+    def test_game_mixed_face_types(self):
+        """Test each die keeps its own face type in the results."""
+        game = Game([Die(np.array([1, 2])), Die(np.array(['x', 'y']))])
+        game.play(10)
+        results = game.show()
+        self.assertTrue(pd.api.types.is_integer_dtype(results['die_0']))
+        self.assertTrue(set(results['die_1']) <= {'x', 'y'})
+
+    def test_game_no_dice(self):
+        """Test playing a game without dice gives empty results."""
+        game = Game([])
+        game.play(3)
+        self.assertTrue(game.show().empty)
+
+    def test_narrow_form(self):
+        """Test the narrow form has one row per die per roll."""
+        faces = np.array(['1', '2', '3'])
+        game = Game([Die(faces), Die(faces)])
+        game.play(4)
+        narrow = game.show('narrow')
+        self.assertEqual(list(narrow.columns), ['roll', 'die', 'outcome'])
+        self.assertEqual(len(narrow), 8)
+
+    def test_narrow_form_before_play(self):
+        """Test the narrow form of an unplayed game is empty with the expected columns."""
+        game = Game([Die(np.array(['1', '2', '3']))])
+        narrow = game.show('narrow')
+        self.assertTrue(narrow.empty)
+        self.assertEqual(list(narrow.columns), ['roll', 'die', 'outcome'])
+
 class TestAnalyzer(unittest.TestCase):
     
     def setUp(self):
@@ -96,6 +215,33 @@ class TestAnalyzer(unittest.TestCase):
         
         self.assertIsInstance(jackpots, int) 
     
+    def test_jackpot_loaded_dice(self):
+        """Test jackpot counts every roll when the dice can only land on one face."""
+        faces = np.array(['1', '2', '3'])
+        die1 = Die(faces)
+        die2 = Die(faces)
+        for die in (die1, die2):
+            die.change_weight('1', 0)
+            die.change_weight('2', 0)
+        game = Game([die1, die2])
+        game.play(20)
+        self.assertEqual(Analyzer(game).jackpot(), 20)
+
+    def test_jackpot_three_dice(self):
+        """Test jackpot matches rows with a single distinct face for three dice."""
+        faces = np.array(['1', '2', '3'])
+        game = Game([Die(faces), Die(faces), Die(faces)])
+        game.play(500)
+        expected = int((game.show().nunique(axis=1) == 1).sum())
+        self.assertEqual(Analyzer(game).jackpot(), expected)
+
+    def test_jackpot_many_rows(self):
+        """Test jackpot across several chunks, including a partial last chunk, for four dice."""
+        faces = np.array(['1', '2'])
+        game = Game([Die(faces) for _ in range(4)])
+        game.play(70000)
+        expected = int((game.show().nunique(axis=1) == 1).sum())
+        self.assertEqual(Analyzer(game).jackpot(), expected)
 
     def test_combo_count(self):
         """Test combo count returns DataFrame with expected indices."""
@@ -108,6 +254,18 @@ class TestAnalyzer(unittest.TestCase):
         combo_df = analyzer.combo_count()
         self.assertTrue(isinstance(combo_df, pd.DataFrame))
 
+    def test_combo_count_values(self):
+        """Test combo count groups rolls regardless of the order of the dice."""
+        faces = np.array(['1', '2', '3'])
+        game = Game([Die(faces), Die(faces), Die(faces)])
+        game.play(200)
+        combo_df = Analyzer(game).combo_count()
+        expected = game.show().apply(lambda row: tuple(sorted(row)), axis=1).value_counts()
+        self.assertEqual(combo_df['counts'].sum(), 200)
+        self.assertTrue(combo_df['counts'].is_monotonic_decreasing)
+        for combo, count in expected.items():
+            self.assertEqual(combo_df.loc[combo, 'counts'], count)
+
     def test_face_counts_per_roll(self):
         """Test face counts per roll returns correct DataFrame format."""
         faces = np.array(['1', '2', '3'])
@@ -119,6 +277,19 @@ class TestAnalyzer(unittest.TestCase):
         count_df = analyzer.face_counts_per_roll()
         self.assertTrue(isinstance(count_df, pd.DataFrame))
 
+    def test_face_counts_per_roll_values(self):
+        """Test face counts per roll has one row per roll and matches the results."""
+        faces = np.array(['1', '2', '3'])
+        game = Game([Die(faces), Die(faces), Die(faces)])
+        game.play(10)
+        count_df = Analyzer(game).face_counts_per_roll()
+        results = game.show()
+        self.assertEqual(len(count_df), 10)
+        self.assertTrue((count_df.sum(axis=1) == 3).all())
+        for roll, row in results.iterrows():
+            for face in row:
+                self.assertEqual(count_df.loc[roll, face], (row == face).sum())
+
     def test_permutation_count(self):
         """Test permutation count returns DataFrame with expected"""
         faces = np.array(['1', '2', '3'])
@@ -130,5 +301,17 @@ class TestAnalyzer(unittest.TestCase):
         perm_df = analyzer.permutation_count()
         self.assertTrue(isinstance(perm_df, pd.DataFrame))
 
+    def test_permutation_count_values(self):
+        """Test permutation count matches counting each ordered roll."""
+        faces = np.array(['1', '2', '3'])
+        game = Game([Die(faces), Die(faces), Die(faces)])
+        game.play(200)
+        perm_df = Analyzer(game).permutation_count()
+        expected = game.show().apply(tuple, axis=1).value_counts()
+        self.assertEqual(len(perm_df), len(expected))
+        self.assertTrue(perm_df['counts'].is_monotonic_decreasing)
+        for perm, count in expected.items():
+            self.assertEqual(perm_df.loc[perm, 'counts'], count)
+
 if __name__ == '__main__':
     unittest.main()